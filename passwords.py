@@ -2,17 +2,28 @@
 """
 Password analyzer with breach-list check, suggestions, and coarse time-to-compromise warnings.
 Usage:
-  1) Optional: pip install requests
+  1) Optional: pip install requests  (or aiohttp to race both download URLs;
+     marisa-trie for a compact, cached top-list index; pyuring on Linux to read the list via io_uring)
   2) Run: python passwords.py
   3) When prompted, enter a password (the script will NOT print a replacement password;
      it only shows short suggestions like "Try adding: a9@" and a coarse 'time to compromise').
 """
 
+from collections import OrderedDict
 from pathlib import Path
 import re
+import asyncio
+import bisect
+import codecs
+import concurrent.futures
+import hmac
 import math
-import random
+import mmap
+import os
+import secrets
 import string
+import sys
+import threading
 
 # Try to import requests (used only for downloading lists). If not present, the script still runs.
 try:
@@ -20,6 +31,42 @@ try:
 except Exception:
     requests = None
 
+# Optional: aiohttp lets download_top_list race the primary and fallback URLs concurrently.
+try:
+    import aiohttp
+except Exception:
+    aiohttp = None
+
+# Optional: marisa-trie stores the top list as a compact on-disk trie that can be mmap'ed on later runs.
+try:
+    import marisa_trie
+except Exception:
+    marisa_trie = None
+
+# Optional: numpy enables analyze_batch() for vectorized bulk auditing.
+try:
+    import numpy as np
+except Exception:
+    np = None
+
+# Optional (with numpy): numba compiles analyze_batch's per-password classification loop.
+try:
+    import numba
+except Exception:
+    numba = None
+
+# Optional: pyahocorasick matches all keyboard runs / weak base words in one automaton pass.
+try:
+    import ahocorasick
+except Exception:
+    ahocorasick = None
+
+# Optional (Linux): pyuring reads the top-list file through io_uring in batched block reads.
+try:
+    import pyuring
+except Exception:
+    pyuring = None
+
 # Primary and fallback URLs for a "top common passwords" list (raw text)
 PRIMARY_URL = "https://www.ncsc.gov.uk/static-assets/documents/PwnedPasswordsTop100k.txt"
 # Fallback (GitHub SecLists - raw). This is commonly available and useful for demos.
@@ -27,10 +74,154 @@ FALLBACK_URL = "https://raw.githubusercontent.com/danielmiessler/SecLists/master
 
 LOCAL_TOP_PATH = Path("pwned_top100k.txt")  # downloaded file path (or place your own file here)
 
+# Character classes used by entropy_estimate, one bit each so a password's classes fold into a mask.
+_CLASS_LOWER, _CLASS_UPPER, _CLASS_DIGIT, _CLASS_SPECIAL = 1, 2, 4, 8
+_SPECIAL_CHARS = "!@#$%^&*(),.?\":{}|<>;'-[]()_+=/\\`~"
+
+
+def _class_of(b: int) -> int:
+    """Class bit for one byte value (0 for bytes outside all four classes)."""
+    ch = chr(b)
+    if ch in string.ascii_lowercase:
+        return _CLASS_LOWER
+    if ch in string.ascii_uppercase:
+        return _CLASS_UPPER
+    if ch in string.digits:
+        return _CLASS_DIGIT
+    if ch in _SPECIAL_CHARS:
+        return _CLASS_SPECIAL
+    return 0
+
+
+# byte value -> class bit; bytes.translate with this table classifies a whole password in C
+_CLASS_TABLE = bytes(_class_of(i) for i in range(256))
+
+
+def _charset_size(mask: int) -> int:
+    """Charset size implied by a class mask."""
+    charset = 0
+    charset += 26 if mask & _CLASS_LOWER else 0
+    charset += 26 if mask & _CLASS_UPPER else 0
+    charset += 10 if mask & _CLASS_DIGIT else 0
+    # estimate of symbol count (conservative)
+    charset += 32 if mask & _CLASS_SPECIAL else 0
+    return charset
+
+
+# class mask (0-15) -> charset size / log2(charset size): entropy_estimate is then two table reads
+_CHARSET_SIZE = tuple(_charset_size(mask) for mask in range(16))
+_LOG2_CHARSET = tuple(math.log2(size) if size else 0.0 for size in _CHARSET_SIZE)
+
+# very common weak base words (checked case-insensitively as substrings)
+_WEAK_BASES = ("password", "passwd", "admin", "welcome", "letmein", "iloveyou")
+# keyboard runs (checked case-insensitively as substrings)
+_KEYBOARD_RUNS = ("qwert", "asdf", "zxcv", "1q2w", "qaz")
+
+# Substring checks. With pyahocorasick, all keyboard runs and weak bases go into one
+# Aho-Corasick automaton (single linear pass, no backtracking however many words are
+# added); the value is the base's index in _WEAK_BASES, or -1 for a keyboard run.
+# Without it, the same checks run as regex lookaheads.
+if ahocorasick is not None:
+    _WORDS_AUTOMATON = ahocorasick.Automaton()
+    for _w in _KEYBOARD_RUNS:
+        _WORDS_AUTOMATON.add_word(_w, -1)
+    for _i, _w in enumerate(_WEAK_BASES):
+        _WORDS_AUTOMATON.add_word(_w, _i)
+    _WORDS_AUTOMATON.make_automaton()
+    del _w, _i
+    _WORDS_RE = None
+else:
+    _WORDS_AUTOMATON = None
+    # each check is an optional lookahead, so a single match() of pw.lower() reports both
+    # through named groups (no (?i): its case folding differs from str.lower, e.g. for "İ")
+    _WORDS_RE = re.compile(
+        r"(?=.*?(?P<keyboard>" + "|".join(_KEYBOARD_RUNS) + r"))?"
+        # one alternative per base, tried in _WEAK_BASES order (first listed base wins)
+        r"(?=" + "|".join(rf".*?(?P<weak{i}>{b})" for i, b in enumerate(_WEAK_BASES)) + r")?",
+        re.DOTALL,
+    )
+
+# "breached-base": pw is a listed password of at least _MIN_BREACHED_BASE_LEN characters plus a
+# suffix of at most _MAX_BREACHED_SUFFIX_LEN ("password1", "dragon!!"); longer tails such as
+# passphrases that merely start with a listed word ("bluesky-Harbor-92!") are not flagged
+_MIN_BREACHED_BASE_LEN = 4
+_MAX_BREACHED_SUFFIX_LEN = 3
+
+# Recent entropy/pattern results, keyed by HMAC-SHA256 of the password under a random
+# per-process key so the cache never holds plaintext passwords (or stable hashes of them).
+_CACHE_KEY = secrets.token_bytes(32)
+_ANALYSIS_CACHE_SIZE = 1024
+_analysis_cache: OrderedDict[bytes, tuple[float, tuple[str, ...]]] = OrderedDict()
+_analysis_cache_lock = threading.Lock()  # guards each get/move/insert/evict sequence on _analysis_cache
+
+# make_short_suggestion alphabets; secrets.randbelow is bound once to skip the attribute lookup
+_SUGGEST_LETTERS = string.ascii_lowercase
+_SUGGEST_DIGITS = string.digits
+_SUGGEST_SYMS = "!@#$%^&*;?"
+_randbelow = secrets.randbelow
+
+# time-to-compromise and strength bands: label i covers values up to edge i (inclusive for
+# ranks, exclusive for entropy); the final label covers everything above the last edge.
+_RANK_EDGES = (100, 1000, 10000, 100000)
+_RANK_LABELS = ("days", "days to weeks", "weeks", "weeks to months", "months (lower risk than top lists)")
+_TTC_ENTROPY_EDGES = (30, 45, 60)
+_TTC_ENTROPY_LABELS = ("days to weeks", "weeks to months", "months to years", "many years (hard to brute-force)")
+_STRENGTH_EDGES = (40, 60)
+_STRENGTH_LABELS = ("Weak", "Moderate", "Strong")
+
+# Entropy bands flattened into lookup tables indexed by int(entropy) // _BAND_WIDTH, clamped
+# to the last entry. Every entropy edge is a multiple of _BAND_WIDTH, so a bin never straddles
+# an edge and the table gives exactly the same label as "entropy < edge" comparisons.
+_BAND_WIDTH = 5
+
+
+def _band_lut(edges: tuple[int, ...], labels: tuple[str, ...]) -> tuple[str, ...]:
+    return tuple(labels[bisect.bisect_right(edges, i * _BAND_WIDTH)] for i in range(edges[-1] // _BAND_WIDTH + 1))
+
+
+_TTC_ENTROPY_LUT = _band_lut(_TTC_ENTROPY_EDGES, _TTC_ENTROPY_LABELS)
+_STRENGTH_LUT = _band_lut(_STRENGTH_EDGES, _STRENGTH_LABELS)
+
+
+async def _fetch(session, url: str) -> bytes:
+    print(f"Attempting download from: {url}")
+    async with session.get(url) as r:
+        r.raise_for_status()
+        return await r.read()
+
+
+async def _race_downloads(urls: tuple[str, ...]) -> bytes:
+    """Request all urls concurrently and return the body of the first successful response."""
+    tried = []
+    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
+        pending = {asyncio.create_task(_fetch(session, url)): url for url in urls}
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # if several finish together, prefer the earlier URL in urls
+                for task in sorted(done, key=lambda t: urls.index(pending[t])):
+                    url = pending.pop(task)
+                    try:
+                        return task.result()
+                    except Exception as e:
+                        tried.append((url, str(e)))
+                        print(f"Download failed from {url}: {e}")
+        finally:
+            # cancel the slower request once we have a winner
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+    raise RuntimeError("All download attempts failed. Tried URLs:\n" + "\n".join(f"{u}: {err}" for u, err in tried))
+
 
 def download_top_list(dest: Path = LOCAL_TOP_PATH):
-    """Try to download a top-password list. Attempts primary URL, then fallback.
-       Writes text to dest. Requires 'requests'."""
+    """Try to download a top-password list. With aiohttp, primary and fallback URLs are raced
+       and the first success wins; otherwise 'requests' tries primary, then fallback.
+       Writes text to dest."""
+    if aiohttp is not None:
+        dest.write_bytes(asyncio.run(_race_downloads((PRIMARY_URL, FALLBACK_URL))))
+        print(f"Saved top-password list to: {dest} (size: {dest.stat().st_size} bytes)")
+        return dest
     if requests is None:
         raise RuntimeError("The 'requests' library is not installed. Install with: pip install requests")
 
@@ -50,67 +241,253 @@ def download_top_list(dest: Path = LOCAL_TOP_PATH):
     raise RuntimeError("All download attempts failed. Tried URLs:\n" + "\n".join(f"{u}: {err}" for u, err in tried))
 
 
-def load_top_list_with_rank(path: Path = LOCAL_TOP_PATH):
-    """Load local file and return dict password -> rank (1 = most common)."""
+class TopList:
+    """Top-password list as a flat password -> rank dict: O(1) exact lookups, and prefix
+       queries answered with one dict probe per candidate length (no per-character nodes)."""
+
+    def __init__(self, ranks: dict[str, int]):
+        self.ranks = ranks
+
+    def lookup(self, pw: str) -> int | None:
+        """Return the rank of pw if it is in the list, else None."""
+        return self.ranks.get(pw)
+
+    def longest_prefix(self, pw: str, min_len: int = 1) -> tuple[int, int] | None:
+        """Return (length, rank) of the longest listed password of at least min_len characters
+           that is a proper prefix of pw, or None."""
+        ranks = self.ranks
+        for k in range(len(pw) - 1, min_len - 1, -1):
+            rank = ranks.get(pw[:k])
+            if rank is not None:
+                return k, rank
+        return None
+
+    # dict-style helpers so callers that used the old password -> rank dict keep working
+    def get(self, pw: str, default=None):
+        return self.ranks.get(pw, default)
+
+    def __contains__(self, pw: str) -> bool:
+        return pw in self.ranks
+
+    def __len__(self) -> int:
+        return len(self.ranks)
+
+
+class MarisaTopList:
+    """Same interface as TopList, backed by a marisa_trie.RecordTrie (a few bytes per entry).
+       Passwords marisa cannot encode (lone surrogates from surrogateescape input) are never listed."""
+    FORMAT = "<I"  # one unsigned 32-bit rank per password
+
+    def __init__(self, trie):
+        self.trie = trie
+
+    def lookup(self, pw: str) -> int | None:
+        try:
+            rec = self.trie.get(pw)
+        except UnicodeEncodeError:
+            return None
+        return rec[0][0] if rec else None
+
+    def longest_prefix(self, pw: str, min_len: int = 1) -> tuple[int, int] | None:
+        try:
+            prefixes = [p for p in self.trie.prefixes(pw) if min_len <= len(p) < len(pw)]
+        except UnicodeEncodeError:
+            return None
+        if not prefixes:
+            return None
+        best = max(prefixes, key=len)
+        return len(best), self.trie[best][0][0]
+
+    def get(self, pw: str, default=None):
+        rank = self.lookup(pw)
+        return default if rank is None else rank
+
+    def __contains__(self, pw: str) -> bool:
+        return self.lookup(pw) is not None
+
+    def __len__(self) -> int:
+        return len(self.trie)
+
+
+_URING_QUEUE_DEPTH = 32
+_URING_BLOCK_SIZE = 1 << 20
+_uring_usable = True  # cleared after the first failed io_uring read; later loads go straight to mmap
+
+
+_SCAN_CHUNK = 1 << 22  # lines are split out of the mapped file 4 MiB at a time
+
+
+def _read_uring_blocks(fd: int, size: int):
+    """Yield the file behind fd as consecutive blocks read through io_uring (pyuring): up to
+       _URING_QUEUE_DEPTH blocks are submitted per round trip. Raises if io_uring is unavailable."""
+    offset = 0
+    with pyuring.UringCtx(entries=_URING_QUEUE_DEPTH) as ctx:
+        while offset < size:
+            blocks = min(_URING_QUEUE_DEPTH, -(-(size - offset) // _URING_BLOCK_SIZE))
+            chunk = ctx.read_batch(fd, _URING_BLOCK_SIZE, blocks, offset)
+            if len(chunk) != min(blocks * _URING_BLOCK_SIZE, size - offset):
+                raise OSError(f"short io_uring read at offset {offset}")
+            yield chunk
+            offset += len(chunk)
+
+
+def _iter_top_blocks(path: Path):
+    """Yield the top-list file as consecutive byte blocks: read via io_uring on Linux when pyuring
+       is available, otherwise sliced from a read-only mmap, so the file is never copied as a whole."""
+    global _uring_usable
+    with open(path, "rb") as f:
+        fd = f.fileno()
+        size = os.fstat(fd).st_size
+        done = 0
+        if pyuring is not None and sys.platform == "linux" and _uring_usable:
+            try:
+                for chunk in _read_uring_blocks(fd, size):
+                    done += len(chunk)
+                    yield chunk
+            except (OSError, ImportError) as e:  # e.g. kernel without io_uring or blocked by seccomp
+                _uring_usable = False
+                print(f"io_uring read of {path} failed ({e}); using mmap instead.")
+        if done < size:  # also skips mapping empty files, which mmap rejects
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                for pos in range(done, size, _SCAN_CHUNK):
+                    yield mm[pos:pos + _SCAN_CHUNK]
+
+
+def _iter_lines(blocks):
+    """Yield the lines (line endings kept) that str.splitlines() would find in the UTF-8 text of
+       blocks, with invalid bytes dropped; only one block's worth of lines exists at a time."""
+    decode = codecs.getincrementaldecoder("utf-8")(errors="ignore").decode
+    tail = ""
+    for block in blocks:
+        lines = (tail + decode(block)).splitlines(keepends=True)
+        tail = lines.pop() if lines else ""
+        # an unterminated last line continues in the next block, and a final "\r" may be half of "\r\n"
+        if tail and not tail.endswith("\r") and tail.splitlines() != [tail]:
+            lines.append(tail)
+            tail = ""
+        yield from lines
+    yield from (tail + decode(b"", final=True)).splitlines(keepends=True)
+
+
+def _iter_top_list(path: Path):
+    """Yield (password, rank) for each non-empty line; duplicates are yielded again with a later rank."""
+    for i, ln in enumerate(_iter_lines(_iter_top_blocks(path)), start=1):
+        ln = ln.strip()  # also drops the line ending kept by _iter_lines
+        if ln:
+            # file lines are treated as passwords (we take first token); most lists hold one token per line
+            yield ln.split(None, 1)[0], i
+
+
+def _read_top_ranks(path: Path) -> dict[str, int]:
+    """Parse path into password -> rank, keeping the earliest (highest) rank for duplicates."""
+    ranks = {}
+    for pw, rank in _iter_top_list(path):
+        ranks.setdefault(pw, rank)
+    return ranks
+
+
+def _source_stamp(path: Path) -> tuple[int, int]:
+    """(mtime_ns, size) of the list file; a cached index is only reused while this still matches."""
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+def _load_marisa_top_list(path: Path) -> MarisaTopList:
+    """Build (or mmap a previously saved) marisa trie for path, saved next to it as *.marisa
+       with the source stamp it was built from in *.marisa.stamp."""
+    idx = path.with_suffix(".marisa")
+    stamp_file = idx.with_name(idx.name + ".stamp")
+    stamp = " ".join(map(str, _source_stamp(path)))
+    try:
+        fresh = stamp_file.read_text(encoding="ascii") == stamp and idx.exists()
+    except (OSError, ValueError):
+        fresh = False
+    if fresh:
+        trie = marisa_trie.RecordTrie(MarisaTopList.FORMAT)
+        trie.mmap(str(idx))
+        return MarisaTopList(trie)
+    ranks = _read_top_ranks(path)
+    trie = marisa_trie.RecordTrie(MarisaTopList.FORMAT, ((pw, (rank,)) for pw, rank in ranks.items()))
+    tmp = idx.with_name(idx.name + ".tmp")
+    try:
+        trie.save(str(tmp))
+        os.replace(tmp, idx)
+        stamp_file.write_text(stamp, encoding="ascii")  # written last: a half-saved index never looks fresh
+    except OSError as e:
+        tmp.unlink(missing_ok=True)
+        print(f"Could not save top-list index to {idx}: {e}")
+    return MarisaTopList(trie)
+
+
+def load_top_list_with_rank(path: Path = LOCAL_TOP_PATH) -> TopList | MarisaTopList:
+    """Load local file and return a lookup of password -> rank (1 = most common).
+       Uses marisa-trie when installed, otherwise a TopList over a plain dict."""
     if not path.exists():
         raise FileNotFoundError(f"{path} not found. Run download_top_list() or place a top-list file there.")
-    d = {}
-    # file lines are treated as passwords (we take first token)
-    for i, ln in enumerate(path.read_text(encoding="utf-8", errors="ignore").splitlines(), start=1):
-        ln = ln.strip().split()[0] if ln.strip() else ""
-        if ln:
-            if ln not in d:  # keep earliest (highest) rank if duplicates
-                d[ln] = i
-    return d
+    if marisa_trie is not None:
+        return _load_marisa_top_list(path)
+    return TopList(_read_top_ranks(path))
 
 
 def entropy_estimate(pw: str) -> float:
     """Estimate entropy in bits using charset size^(length) -> length * log2(charset)."""
-    if not pw:
-        return 0.0
-    lower = bool(re.search(r"[a-z]", pw))
-    upper = bool(re.search(r"[A-Z]", pw))
-    digit = bool(re.search(r"\d", pw))
-    special = bool(re.search(r"[!@#$%^&*(),.?\":{}|<>;'\-\[\]\(\)_+=/\\|`~]", pw))
-    charset = 0
-    charset += 26 if lower else 0
-    charset += 26 if upper else 0
-    charset += 10 if digit else 0
-    # estimate of symbol count (conservative)
-    charset += 32 if special else 0
-    if charset <= 0:
-        return 0.0
-    return len(pw) * math.log2(charset)
+    # one C-level translate pass maps every byte to its class bit; at most 5 distinct values remain
+    mask = 0
+    for bit in set(pw.encode("ascii", errors="ignore").translate(_CLASS_TABLE)):
+        mask |= bit
+    if not mask & _CLASS_DIGIT and not pw.isascii() and any(c.isdecimal() for c in pw):
+        mask |= _CLASS_DIGIT  # non-ASCII digits, as matched by \d
+    return len(pw) * _LOG2_CHARSET[mask]  # mask 0 (incl. empty pw) -> 0.0
+
 
+def _word_hits(pw: str, low: str | None = None) -> tuple[bool, str | None]:
+    """Return (contains a keyboard run, first weak base in _WEAK_BASES order that pw contains).
+       low is pw.lower() if the caller already has it."""
+    if low is None:
+        low = pw if pw.isascii() and pw.islower() else pw.lower()  # already-lowercase ASCII needs no copy
+    if _WORDS_AUTOMATON is not None:
+        keyboard = False
+        weak = None
+        for _, idx in _WORDS_AUTOMATON.iter(low):
+            if idx < 0:
+                keyboard = True
+            elif weak is None or idx < weak:
+                weak = idx
+        return keyboard, (None if weak is None else _WEAK_BASES[weak])
+    m = _WORDS_RE.match(low)
+    weak = next((b for i, b in enumerate(_WEAK_BASES) if m[f"weak{i}"] is not None), None)
+    return m["keyboard"] is not None, weak
 
-def simple_patterns(pw: str):
-    """Return quick heuristic pattern labels for common weak patterns."""
+
+def simple_patterns(pw: str, _low: str | None = None):
+    """Return quick heuristic pattern labels for common weak patterns.
+       _low: pw.lower(), if the caller has already computed it."""
     pats = []
     if len(pw) < 8:
         pats.append("short")
-    if re.fullmatch(r"\d+", pw):
+    keyboard, weak = _word_hits(pw, _low)
+    # structural checks are plain str methods (single C-level scans, no regex engine):
+    if pw.isdecimal():  # same characters as \d
         pats.append("all-digits")
-    if re.fullmatch(r"(.)\1{3,}", pw):  # 4+ repeated characters
+    if len(pw) >= 4 and pw[0] != "\n" and pw.count(pw[0]) == len(pw):  # 4+ repeated characters ("." never matched "\n")
         pats.append("repeated-chars")
-    if re.search(r"(qwert|asdf|zxcv|1q2w|qaz)", pw.lower()):
+    if keyboard:
         pats.append("keyboard-pattern")
-    if re.search(r"\d{4}$", pw):
+    body = pw[:-1] if pw.endswith("\n") else pw  # "\d{4}$" also matched before a final newline
+    if len(body) >= 4 and body[-4:].isdecimal():
         pats.append("year-suffix")
-    # very common weak base words:
-    weak_bases = ("password", "passwd", "admin", "welcome", "letmein", "iloveyou")
-    low = pw.lower()
-    for b in weak_bases:
-        if b in low:
-            pats.append(f"contains-{b}")
-            break
+    if weak is not None:
+        pats.append(f"contains-{weak}")
     return pats
 
 
 def make_short_suggestion():
     """Produce a short 3-character non-revealing suggestion: lower + digit + symbol."""
-    letters = string.ascii_lowercase
-    syms = "!@#$%^&*;?"
-    return random.choice(letters) + random.choice(string.digits) + random.choice(syms)
+    # one draw from the OS CSPRNG covers all three picks (unbiased, unlike bytes % n)
+    n = _randbelow(len(_SUGGEST_LETTERS) * len(_SUGGEST_DIGITS) * len(_SUGGEST_SYMS))
+    n, sym = divmod(n, len(_SUGGEST_SYMS))
+    letter, digit = divmod(n, len(_SUGGEST_DIGITS))
+    return _SUGGEST_LETTERS[letter] + _SUGGEST_DIGITS[digit] + _SUGGEST_SYMS[sym]
 
 
 def estimate_time_to_compromise(entropy: float, rank: int | None):
@@ -121,36 +498,43 @@ def estimate_time_to_compromise(entropy: float, rank: int | None):
     NOTE: This is illustrative only, not exact.
     """
     if rank is not None:
-        if rank <= 100:
-            return "days"
-        if rank <= 1000:
-            return "days to weeks"
-        if rank <= 10000:
-            return "weeks"
-        if rank <= 100000:
-            return "weeks to months"
-        return "months (lower risk than top lists)"
+        return _RANK_LABELS[bisect.bisect_left(_RANK_EDGES, rank)]
     # entropy-based fallback
-    if entropy < 30:
-        return "days to weeks"
-    if entropy < 45:
-        return "weeks to months"
-    if entropy < 60:
-        return "months to years"
-    return "many years (hard to brute-force)"
+    return _TTC_ENTROPY_LUT[min(int(entropy) // _BAND_WIDTH, len(_TTC_ENTROPY_LUT) - 1)]
+
 
+def _cached_checks(pw: str) -> tuple[float, tuple[str, ...]]:
+    """entropy_estimate + simple_patterns for pw, memoized in a small LRU keyed by HMAC(pw)."""
+    key = hmac.new(_CACHE_KEY, pw.encode("utf-8", errors="surrogatepass"), "sha256").digest()
+    with _analysis_cache_lock:
+        res = _analysis_cache.get(key)
+        if res is not None:
+            _analysis_cache.move_to_end(key)
+            return res
+    res = (entropy_estimate(pw), tuple(simple_patterns(pw)))  # computed outside the lock
+    with _analysis_cache_lock:
+        _analysis_cache[key] = res
+        if len(_analysis_cache) > _ANALYSIS_CACHE_SIZE:
+            _analysis_cache.popitem(last=False)
+    return res
 
-def analyze_password(pw: str, top_dict: dict | None = None):
+
+def analyze_password(pw: str, top_dict: TopList | MarisaTopList | None = None):
     """Analyze password. Returns a dict of results (no full password output)."""
     pw_s = pw.strip()
-    entropy = entropy_estimate(pw_s)
-    pats = simple_patterns(pw_s)
+    entropy, pats = _cached_checks(pw_s)
+    pats = list(pats)
 
     rank = None
     in_top = False
     if top_dict is not None:
-        rank = top_dict.get(pw_s)
-        in_top = pw_s in top_dict
+        rank = top_dict.lookup(pw_s)
+        in_top = rank is not None
+        if not in_top:
+            # common mutation of a breached password, e.g. "password1" or "dragon!!"
+            min_base = max(_MIN_BREACHED_BASE_LEN, len(pw_s) - _MAX_BREACHED_SUFFIX_LEN)
+            if top_dict.longest_prefix(pw_s, min_base) is not None:
+                pats.append("breached-base")
 
     tips = []
     if in_top:
@@ -162,12 +546,7 @@ def analyze_password(pw: str, top_dict: dict | None = None):
         suggestion = make_short_suggestion()
         tips.append(f"Try adding: {suggestion}  (suggestion — add these characters somewhere in your password)")
     # Strength label based on entropy bands (simple)
-    if entropy < 40:
-        strength = "Weak"
-    elif entropy < 60:
-        strength = "Moderate"
-    else:
-        strength = "Strong"
+    strength = _STRENGTH_LUT[min(int(entropy) // _BAND_WIDTH, len(_STRENGTH_LUT) - 1)]
 
     ttc = estimate_time_to_compromise(entropy, rank)
 
@@ -182,26 +561,105 @@ def analyze_password(pw: str, top_dict: dict | None = None):
     }
 
 
+if numba is not None:
+    @numba.njit(cache=True)
+    def _class_masks_nb(buf, starts, ends, table):
+        """Class-bit mask per password: one compiled pass over buf, no per-byte temporaries."""
+        masks = np.zeros(starts.shape[0], dtype=np.uint8)
+        for i in range(starts.shape[0]):
+            m = 0
+            for j in range(starts[i], ends[i]):
+                m |= table[buf[j]]
+                if m == 15:  # all four classes seen; the rest of the password can't add any
+                    break
+            masks[i] = m
+        return masks
+
+
+def analyze_batch(pws: list[str], top_dict: TopList | MarisaTopList | None = None):
+    """Vectorized entropy/strength/rank for many passwords at once (bulk auditing). Requires numpy.
+       Returns a dict of arrays aligned with pws; rank is 0 where a password is not in the top list."""
+    if np is None:
+        raise RuntimeError("analyze_batch needs numpy. Install with: pip install numpy")
+    pws = [pw.strip() for pw in pws]
+    n = len(pws)
+    enc = [pw.encode("utf-8", errors="surrogatepass") for pw in pws]
+    lens = np.fromiter(map(len, pws), dtype=np.int64, count=n)
+    byte_lens = np.fromiter(map(len, enc), dtype=np.int64, count=n)
+    buf = np.frombuffer(b"".join(enc), dtype=np.uint8)
+
+    table = np.frombuffer(_CLASS_TABLE, dtype=np.uint8)  # same classes entropy_estimate uses
+    ends = np.cumsum(byte_lens)
+    starts = ends - byte_lens
+    if numba is not None:
+        masks = _class_masks_nb(buf, starts, ends, table)
+    else:
+        # per-byte class bits, OR-ed over each password's byte range (empty passwords keep mask 0)
+        codes = table[buf]
+        masks = np.zeros(n, dtype=np.uint8)
+        nonempty = byte_lens > 0
+        if nonempty.any():
+            masks[nonempty] = np.bitwise_or.reduceat(codes, starts[nonempty])
+
+    entropy = lens * np.asarray(_LOG2_CHARSET, dtype=np.float64)[masks]
+    # non-ASCII rows may contain Unicode digits; defer those few to the scalar path
+    for i in np.flatnonzero(byte_lens != lens):
+        entropy[i] = entropy_estimate(pws[i])
+
+    bands = np.minimum(entropy.astype(np.int64) // _BAND_WIDTH, len(_STRENGTH_LUT) - 1)
+    strength = np.asarray(_STRENGTH_LUT)[bands]
+    if top_dict is not None:
+        ranks = np.fromiter((top_dict.lookup(pw) or 0 for pw in pws), dtype=np.int64, count=n)
+    else:
+        ranks = np.zeros(n, dtype=np.int64)
+
+    return {
+        "entropy_bits": np.round(entropy, 2),
+        "strength": strength,
+        "in_top": ranks > 0,
+        "rank": ranks,
+    }
+
+
+def _load_top_async(holder: concurrent.futures.Future, path: Path = LOCAL_TOP_PATH):
+    """Thread target: load the top list and publish it (or the error) through holder."""
+    try:
+        holder.set_result(load_top_list_with_rank(path))
+    except BaseException as e:
+        holder.set_exception(e)
+
+
+# seconds interactive_main waits at exit for a loader that is still building the marisa index
+_LOADER_EXIT_WAIT = 10.0
+
+
+def _start_top_loader(path: Path = LOCAL_TOP_PATH) -> concurrent.futures.Future:
+    """Load the top list on a daemon thread; the returned future resolves to the top list."""
+    holder = concurrent.futures.Future()
+    threading.Thread(target=_load_top_async, args=(holder, path), daemon=True).start()
+    return holder
+
+
 def interactive_main():
-    """Interactive CLI flow: tries to load local top list; if not present, prompts to download."""
+    """Interactive CLI flow: loads the local top list in the background (prompting right away);
+       if not present, prompts to download."""
     print("Password Analyzer — defensive checks only (no password is stored or printed).")
     top = None
-    # attempt to load local list
-    try:
-        top = load_top_list_with_rank()
-        print(f"Loaded local top list ({len(top)} entries) for rank-based warnings.")
-    except FileNotFoundError:
+    top_future = None
+    # attempt to load local list without blocking the first prompt
+    if LOCAL_TOP_PATH.exists():
+        top_future = _start_top_loader()
+        print("Loading local top list in the background for rank-based warnings...")
+    else:
         print(f"No local toplist found at '{LOCAL_TOP_PATH}'.")
-        if requests is not None:
+        if requests is not None or aiohttp is not None:
             resp = input("Would you like to try downloading a toplist now? (y/N) ").strip().lower()
             if resp == "y":
                 try:
                     download_top_list()
-                    top = load_top_list_with_rank()
-                    print(f"Loaded downloaded top list ({len(top)} entries).")
+                    top_future = _start_top_loader()
                 except Exception as e:
-                    print("Download or load failed:", e)
-                    top = None
+                    print("Download failed:", e)
         else:
             print("Install 'requests' (pip install requests) to enable automatic download.")
 
@@ -211,6 +669,16 @@ def interactive_main():
             if not pw:
                 print("Exiting.")
                 break
+            if top_future is not None:
+                try:
+                    top = top_future.result(timeout=0)
+                    print(f"Loaded top list ({len(top)} entries) for rank-based warnings.")
+                    top_future = None
+                except concurrent.futures.TimeoutError:
+                    print("(top list still loading — this check skips the breached-list lookup)")
+                except Exception as e:
+                    print("Top list load failed:", e)
+                    top_future = None
             res = analyze_password(pw, top_dict=top)
             print("\n=== Analysis ===")
             print("Estimated entropy (bits):", res["entropy_bits"])
@@ -226,6 +694,15 @@ def interactive_main():
                 print("No immediate suggestions. Consider using a password manager + 2FA.")
     except KeyboardInterrupt:
         print("\nInterrupted. Bye.")
+    finally:
+        # the loader is a daemon thread: without this wait a quick session would kill it mid-build
+        # and the next run would parse the list again (a half-written index is never reused)
+        if top_future is not None and marisa_trie is not None and not top_future.done():
+            print(f"Finishing the top-list index (up to {_LOADER_EXIT_WAIT:g} s)...")
+            try:
+                concurrent.futures.wait([top_future], timeout=_LOADER_EXIT_WAIT)
+            except KeyboardInterrupt:
+                pass
 
 
 if __name__ == "__main__":